@@ -294,26 +294,13 @@ class Server(object):
             self.hook = weechat.hook_fd(self.sock.fileno(), 1, 0, 0, "socket_cb", "")
 
         # WEBEX HOOK
-        # Delete old webex hooks if any
+        # Reuse or update the existing webex hook instead of deleting it
+        # and creating a new one
         try:
-            self.delete_webex_hook()
-        except Exception as e:
-            self.prnt(f"Error while deleting old hooks: {e}")
-        # Now create a new one
-        self.prnt('Creating Webex Webhook')
-        # Base url is supposed to be public so webex can talk to us
-        # This is the web server that will proxypass to the socket
-        base_url = self.get_config_value("base_url")
-        try:
-            self.webexapi.webhooks.create(
-                name="weechat_hook",
-                targetUrl=f"{base_url}/webhook",
-                resource="messages",
-                event="created")
+            self.reconcile_webex_hook()
         except Exception as e:
-            self.prnt(f"Error while creating webex webhook: {e}")
+            self.prnt(f"Error while setting up webex webhook: {e}")
             return False
-        self.prnt('Webex Webhook created')
         return True
 
     def connect_webex(self):
@@ -400,6 +387,49 @@ class Server(object):
                 self.prnt("Removing webex hook")
                 self.webexapi.webhooks.delete(hook.id)
 
+    def reconcile_webex_hook(self):
+        """Make sure exactly one webex hook created by weechat is active"""
+        # Base url is supposed to be public so webex can talk to us
+        # This is the web server that will proxypass to the socket
+        target_url = f"{self.get_config_value('base_url')}/webhook"
+        # All hooks named weechat_hook are considered ours, so only one
+        # weechat instance per webex account is supported
+        hooks = [x for x in self.webexapi.webhooks.list() if x.name == "weechat_hook"]
+
+        # Resource, event and filter cannot be updated, so keep only a hook
+        # matching them, preferably an active one with the right URL
+        candidates = [x for x in hooks
+                      if x.resource == "messages" and x.event == "created" and not x.filter]
+        candidates.sort(key=lambda x: (x.targetUrl != target_url, x.status != "active"))
+        if candidates:
+            keep = candidates[0]
+            if keep.targetUrl != target_url or keep.status != "active":
+                self.prnt('Updating Webex Webhook')
+                self.webexapi.webhooks.update(keep.id,
+                                              name="weechat_hook",
+                                              targetUrl=target_url,
+                                              status="active")
+            else:
+                self.prnt('Reusing Webex Webhook')
+        else:
+            self.prnt('Creating Webex Webhook')
+            keep = self.webexapi.webhooks.create(
+                name="weechat_hook",
+                targetUrl=target_url,
+                resource="messages",
+                event="created")
+            self.prnt('Webex Webhook created')
+
+        # Delete duplicates, only after the new hook is in place
+        # A failure here does not prevent the kept hook from working
+        for hook in hooks:
+            if hook.id != keep.id:
+                self.prnt("Removing webex hook")
+                try:
+                    self.webexapi.webhooks.delete(hook.id)
+                except Exception as e:
+                    self.prnt(f"Error while deleting old hook: {e}")
+
     def get_config_value(self, option):
         """ Get an option """
         global webex_config_option